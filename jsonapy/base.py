@@ -212,6 +212,15 @@ Summary of attributes which can be defined in the `Meta` inner class:
 - `links_factories`: A dictonary containing factories functions used to
   generate resources links when they are exported. The keys are the names of
   the links and the values their factories functions.
+- `use_slots`: A boolean indicating that the annotated fields must be stored
+  in `__slots__` instead of the instance `__dict__`. Slotted resources are
+  lighter and faster to access, but they only accept the annotated fields:
+  non-field attributes (like meta attributes) cannot be set on them, and
+  fields with a class-level default value are rejected with a `ValueError`
+  at class creation.
+- `camelize`: A boolean indicating that the fields names must be converted
+  from snake_case to camelCase when exported (`True` by default). Set it to
+  `False` to export the names as they are declared.
 
 During runtime, these metadata can be accessed with special attributes directly
 on the resource classes. For example, the value of `is_abstract` is available
@@ -246,13 +255,15 @@ BResource.__links_factories__
 ```
 """
 
-import collections.abc
+import functools
 import inspect
 import json
+import sys
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import ForwardRef
+from typing import FrozenSet
 from typing import Iterable
 from typing import Literal
 from typing import Mapping
@@ -264,52 +275,196 @@ from typing import Union
 from typing import get_args
 from typing import get_type_hints
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from jsonapy import utils
 
 
 __all__ = ("BaseResource", "create_resource", "BaseResourceMeta")
 
 
+# forbidden fields, see https://jsonapi.org/format/#document-resource-object-fields
+_FORBIDDEN_FIELDS = frozenset({"type", "links", "relationships"})
+# identifier fields, see https://jsonapi.org/format/#document-resource-identifier-objects
+_IDENTIFIER_FIELDS = frozenset({"type", "id"})
+
+
+if orjson is not None:
+    def _default_dump_function(data: Dict) -> str:
+        return orjson.dumps(data).decode()
+
+    _default_bytes_dump_function = orjson.dumps
+else:
+    _default_dump_function = json.dumps
+
+    def _default_bytes_dump_function(data: Dict) -> bytes:
+        return json.dumps(data).encode()
+
+# incremental encoder used by BaseResource.dump_stream()
+_stream_encoder = json.JSONEncoder()
+
+
 def _validate_link_name(klass, name):
     """Check if the link name is consistent with the resource class.
 
     If the link name is a relationship-qualified name, check if the
     relationship exists. Else raise a `ValueError`.
     """
-    split_name = name.split("__")
-    if len(split_name) > 1:
-        relationship_name = split_name[0]
-        if relationship_name not in klass.__relationships_fields_set__:
-            raise ValueError(f"'{relationship_name}' is not a valid relationship for {klass.__name__}.")
+    relationship_name, sep, _ = name.partition("__")
+    if sep and relationship_name not in klass.__relationships_fields_set__:
+        raise ValueError(f"'{relationship_name}' is not a valid relationship for {klass.__name__}.")
+
+
+def _index_links_by_rel(klass):
+    """Rebuild the per-relationship index of registered link names.
+
+    The index maps a relationship name (or `None` for the resource's own
+    links) to the frozenset of unqualified link names registered for it,
+    so validation can test membership without rebuilding qualified names.
+    """
+    by_rel = {None: set()}
+    for qual_name in klass.__links_factories__:
+        rel, sep, link_name = qual_name.partition("__")
+        if sep:
+            by_rel.setdefault(rel, set()).add(link_name)
+        else:
+            by_rel[None].add(qual_name)
+    klass.__links_by_rel__ = {
+        rel: frozenset(names) for rel, names in by_rel.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_links_factories(klass, relationship, names):
+    """Resolve a frozenset of link names to their registered factories.
+
+    Return a dictionary mapping each name to its factory (or `None` when no
+    factory is registered for it). For a given `(class, relationship, names)`
+    combination the resolution is fixed, so it is memoized. The cache is
+    cleared when a new factory is registered (see
+    `BaseResource.register_link_factory()`).
+    """
+    prefix = f"{relationship}__" if relationship else ""
+    factories = klass.__links_factories__
+    return {name: factories.get(prefix + name) for name in names}
+
+
+def _fast_identifier_dict(self):
+    """Build the identifier object without the meta attributes branch.
+
+    Installed as the `_identifier_dict` property of the resource classes
+    which have no identifier meta attribute (the common case).
+    """
+    return {"type": self.__resource_name__, "id": self.id}
+
+
+_fast_identifier_property = property(_fast_identifier_dict)
+
+
+def _identifier_dict_with_meta(self):
+    """Build the identifier object, including the identifier meta attributes.
+
+    Installed as the `_identifier_dict` property of the resource classes
+    defining identifier meta attributes.
+    """
+    return {
+        "type": self.__resource_name__,
+        "id": self.id,
+        "meta": {name: getattr(self, name)
+                 for name in self.__identifier_meta_attributes__},
+    }
+
+
+_meta_identifier_property = property(_identifier_dict_with_meta)
 
 
 def _make_fields_meta_attributes(cls, forbidden_fields, mcs):
+    if not cls.__dict__.get("__annotations__"):
+        # no new field: the bases already carry their evaluated hints, no
+        # need to pay a full get_type_hints() resolution
+        fields_type_hints = {}
+        for base in cls.__bases__:
+            fields_type_hints.update(getattr(base, "__fields_types__", {}))
+        return _set_fields_special_attributes(
+            cls, forbidden_fields, mcs, fields_type_hints)
+    own_annotations = cls.__dict__["__annotations__"]
+    # only the class own annotations still need an evaluation: each base
+    # already carries its evaluated hints in __fields_types__, so
+    # get_type_hints() is run on a bare holder class instead of the whole MRO
+    holder = type("_AnnotationsHolder", (), {
+        "__annotations__": own_annotations,
+        "__module__": cls.__module__})
     frame = inspect.currentframe()
     try:
-        fields_type_hints = get_type_hints(
-            cls,
+        own_hints = get_type_hints(
+            holder,
             localns=frame.f_back.f_back.f_locals,
             globalns=frame.f_back.f_back.f_globals)
     except NameError:
-        fields_type_hints = {
-            name: type_hint
-            for klass in cls.mro()
-            if isinstance(klass, BaseResourceMeta)
-            for name, type_hint in klass.__annotations__.items()}
+        # not all type hints can be evaluated yet: fall back on the raw
+        # annotations
+        own_hints = own_annotations
     finally:
         del frame
-    # members special attributes
-    annotations_items = fields_type_hints.items()
+    fields_type_hints = {}
+    for base in cls.__bases__:
+        fields_type_hints.update(getattr(base, "__fields_types__", {}))
+    fields_type_hints.update(own_hints)
+    return _set_fields_special_attributes(cls, forbidden_fields, mcs, fields_type_hints)
+
+
+def _set_fields_special_attributes(cls, forbidden_fields, mcs, fields_type_hints,
+                                   reclassify_all=False):
+    """Partition the fields and set the fields-related special attributes.
+
+    By default the bases' sets are reused so only the class own annotations
+    (including overriding ones) are classified. With `reclassify_all`, every
+    field is classified from the passed hints instead: this is needed after a
+    forward-refs evaluation, where inherited hints may have changed.
+    """
     cls.__fields_types__ = fields_type_hints
-    cls.__atomic_fields_set__ = {
-        name
-        for name, type_ in annotations_items
-        if not utils.is_type_hint_instance_of(type_, mcs)
-    } - forbidden_fields
-    cls.__relationships_fields_set__ = {
-        name
-        for name, type_ in annotations_items
-        if utils.is_type_hint_instance_of(type_, mcs)}
+    atomic_fields, relationships_fields = set(), set()
+    if reclassify_all:
+        names_to_classify = fields_type_hints.keys()
+    else:
+        for base in cls.__bases__:
+            atomic_fields |= getattr(base, "__atomic_fields_set__", set())
+            relationships_fields |= getattr(base, "__relationships_fields_set__", set())
+        names_to_classify = cls.__dict__.get("__annotations__", {}).keys()
+        # an overriding annotation may change a field's classification
+        atomic_fields -= names_to_classify
+        relationships_fields -= names_to_classify
+    checked_hints = {}
+    for name in names_to_classify:
+        type_ = fields_type_hints[name]
+        if isinstance(type_, mcs):
+            # a bare resource class, no need to unwrap the hint
+            relationships_fields.add(name)
+            continue
+        is_relationship = checked_hints.get(type_)
+        if is_relationship is None:
+            is_relationship = checked_hints[type_] = utils.is_type_hint_instance_of(
+                type_, mcs)
+        (relationships_fields if is_relationship else atomic_fields).add(name)
+    cls.__atomic_fields_set__ = frozenset(atomic_fields - forbidden_fields)
+    cls.__relationships_fields_set__ = frozenset(relationships_fields)
+    # precomputed resolution of the "__all__" literal, and a fresh cache:
+    # re-evaluating forward refs can change the atomic fields set
+    cls.__all_resolved__ = (
+        cls.__atomic_fields_set__,
+        cls.__atomic_fields_set__ - _IDENTIFIER_FIELDS,
+        True)
+    cls.__required_cache__ = {}
+    # precomputed type-hint classifications, to avoid typing introspection
+    # at serialization and attribute-access time
+    cls.__optional_fields__ = frozenset(
+        name for name, type_ in fields_type_hints.items()
+        if utils.is_an_optional_type_hint(type_))
+    cls.__iterable_fields__ = frozenset(
+        name for name, type_ in fields_type_hints.items()
+        if utils.is_an_iterable_type_hint(type_))
     return fields_type_hints
 
 
@@ -328,6 +483,11 @@ class BaseResourceMeta(type):
       fields).
     - `__relationships_fields_set__`: a set containing the names of the fields
       referring another resource.
+    - `__required_cache__`: a dictionary caching the validated required
+      attributes sets passed to `BaseResource.jsonapi_dict()`.
+    - `__camel_names__`: a dictionary mapping the fields and meta attributes
+      names to their exported form: camelCase, or as-declared when
+      `Meta.camelize` is `False`.
 
     ###### Extraction of `Meta` attributes ######
 
@@ -335,6 +495,8 @@ class BaseResourceMeta(type):
     special attributes:
 
     - `__is_abstract__`: the `Meta.is_abstract` attribute if defined, else `False`.
+    - `__use_slots__`: the `Meta.use_slots` attribute if defined, else `False`.
+      When it is true, the annotated fields are stored in `__slots__`.
     - `__resource_name__`: the `Meta.resource_name` attribute if defined, else
       the name of the resource class.
     - `__identifier_meta_attributes__`: the `Meta.identifier_meta_attributes` attribute
@@ -353,14 +515,26 @@ class BaseResourceMeta(type):
         except KeyError:
             meta = {}
 
-        cls = super().__new__(mcs, name, bases, namespace)
+        use_slots = meta.get("use_slots", False)
+        if use_slots and "__slots__" not in namespace:
+            # a default-valued field cannot be slotted: it would end up as a
+            # read-only class attribute failing at the first assignment, so
+            # refuse the definition instead
+            defaulted_fields = [
+                field_name
+                for field_name in namespace.get("__annotations__", ())
+                if field_name in namespace]
+            if defaulted_fields:
+                raise ValueError(
+                    "Slotted resources cannot define default values for "
+                    "their fields: "
+                    + ", ".join(f"'{name}'" for name in defaulted_fields)
+                    + ".")
+            namespace["__slots__"] = tuple(namespace.get("__annotations__", ()))
 
-        # forbidden fields, see https://jsonapi.org/format/#document-resource-object-fields
-        forbidden_fields = {"type", "links", "relationships"}
-        # identifier fields, see https://jsonapi.org/format/#document-resource-identifier-objects
-        identifier_fields = {"type", "id"}
+        cls = super().__new__(mcs, name, bases, namespace)
 
-        fields_type_hints = _make_fields_meta_attributes(cls, forbidden_fields, mcs)
+        fields_type_hints = _make_fields_meta_attributes(cls, _FORBIDDEN_FIELDS, mcs)
 
         links_factories = {}
         for name, factory in meta.get("links_factories", {}).items():
@@ -369,17 +543,41 @@ class BaseResourceMeta(type):
 
         # meta special attributes
         cls.__links_factories__ = links_factories
+        _index_links_by_rel(cls)
         cls.__is_abstract__ = meta.get("is_abstract", False)
-        cls.__resource_name__ = meta.get("resource_name", cls.__name__)
-        cls.__identifier_meta_attributes__ = set(meta.get("identifier_meta_attributes", set()))
-        cls.__meta_attributes__ = set(meta.get("meta_attributes", set()))
+        cls.__use_slots__ = use_slots or any(
+            getattr(base, "__use_slots__", False) for base in bases)
+        # interned: these strings end up as dict keys of every dumped payload
+        cls.__resource_name__ = sys.intern(meta.get("resource_name", cls.__name__))
+        cls.__identifier_meta_attributes__ = frozenset(meta.get("identifier_meta_attributes", ()))
+        # the property must be installed on every class: a specialized parent
+        # would otherwise shadow the right variant for its subclasses
+        cls._identifier_dict = (
+            _fast_identifier_property
+            if not cls.__identifier_meta_attributes__
+            else _meta_identifier_property)
+        cls.__meta_attributes__ = frozenset(meta.get("meta_attributes", ()))
+        camelize = meta.get("camelize", True)
+        cls.__camel_names__ = {
+            name: sys.intern(utils.snake_to_camel_case(name) if camelize else name)
+            for name in {*fields_type_hints, *cls.__meta_attributes__}}
 
         if not cls.__is_abstract__ and "id" not in fields_type_hints:
             raise AttributeError("A Resource must have an 'id' attribute.")
 
-        # utilitarian private attributes
-        cls._forbidden_fields = forbidden_fields
-        cls._identifier_fields = identifier_fields
+        cls.__reserved_names__ = (
+            frozenset(dir(cls)) - fields_type_hints.keys() | _FORBIDDEN_FIELDS)
+
+        if not cls.__use_slots__:
+            # scalar fields default to None at class level so that accessing
+            # an unset field stays a C-level lookup instead of invoking the
+            # __getattr__ fallback; iterable fields keep the fallback because
+            # a shared class-level [] would be aliased between instances
+            for field_name in fields_type_hints:
+                if (field_name != "id"
+                        and field_name not in cls.__iterable_fields__
+                        and not hasattr(cls, field_name)):
+                    setattr(cls, field_name, None)
 
         return cls
 
@@ -396,23 +594,33 @@ class BaseResource(metaclass=BaseResourceMeta):
     if TYPE_CHECKING:
         # for IDE, provided by metaclass
         __fields_types__: Dict[str, type]
-        __atomic_fields_set__: Set[str]
-        __relationships_fields_set__: Set[str]
+        __atomic_fields_set__: FrozenSet[str]
+        __relationships_fields_set__: FrozenSet[str]
         __resource_name__: str
         __is_abstract__: bool
-        __identifier_meta_attributes__: Set[str]
+        __use_slots__: bool
+        __identifier_meta_attributes__: FrozenSet[str]
         __links_factories__: Dict[str, Callable[..., str]]
-        _identifier_fields: Set[str]
-        _forbidden_fields: Set[str]
+        __links_by_rel__: Dict[Optional[str], frozenset]
+        __required_cache__: Dict[frozenset, Tuple[frozenset, frozenset, bool]]
+        __all_resolved__: Tuple[frozenset, frozenset, bool]
+        __reserved_names__: frozenset
+        __camel_names__: Dict[str, str]
+        __optional_fields__: frozenset
+        __iterable_fields__: frozenset
 
         # must be provided by subclasses
         id: Any
 
+    __slots__ = ()
+
     class Meta:
         is_abstract: bool = True
         resource_name: str
         identifier_meta_attributes: Set[str]
         links_factories: Dict[str, Callable[..., str]]
+        use_slots: bool
+        camelize: bool
 
     def __init__(self, **kwargs):
         """Automatically set all passed arguments.
@@ -423,16 +631,16 @@ class BaseResource(metaclass=BaseResourceMeta):
         for type_hint in self.__fields_types__.values():
             if type_hint is ForwardRef or ForwardRef in get_args(type_hint):
                 raise Warning("Not all type hints were evaluated.")
-        errors = []
-        for name in kwargs:
-            if ((getattr(self, name, None) is not None
-                 and name not in self.__fields_types__)
-                    or name in self._forbidden_fields):
-                errors.append(f"    This attribute name is reserved: '{name}'.")
-        if errors:
-            raise ValueError("\n" + "\n".join(errors))
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        reserved_names = self.__reserved_names__.intersection(kwargs)
+        if reserved_names:
+            raise ValueError("\n" + "\n".join(
+                f"    This attribute name is reserved: '{name}'."
+                for name in reserved_names))
+        if self.__use_slots__:
+            for k, v in kwargs.items():
+                setattr(self, k, v)
+        else:
+            self.__dict__.update(kwargs)
 
     ###########################################################################
     #                           P U B L I C   A P I                           #
@@ -520,32 +728,93 @@ class BaseResource(metaclass=BaseResourceMeta):
         ```
 
         """
-        if not hasattr(self, "id"):
-            raise AttributeError(f"This '{self.__class__.__name__}' object has no id.")
-        data = {
-            "type": self.__resource_name__,
-            "id": self.id,
-        }
+        try:
+            resource_id = self.id
+        except AttributeError:
+            raise AttributeError(
+                f"This '{self.__class__.__name__}' object has no id.") from None
         filtered_attributes, meta_attributes = self._filtered_attributes(
             required_attributes, dontformat)
-        if filtered_attributes:
-            data["attributes"] = filtered_attributes
-        if relationships:
-            self._validate_relationships(relationships)
-            data["relationships"] = self._formatted_relationships(relationships)
         if links:
             self._validate_links(links)
-            data["links"] = self._make_links(links)
-        if meta_attributes:
-            data["meta"] = meta_attributes
-        return data
+        return {
+            "type": self.__resource_name__,
+            "id": resource_id,
+            **({"attributes": filtered_attributes} if filtered_attributes else {}),
+            **({"relationships": self._formatted_relationships(relationships)}
+               if relationships else {}),
+            **({"links": self._make_links(links)} if links else {}),
+            **({"meta": meta_attributes} if meta_attributes else {}),
+        }
+
+    @classmethod
+    def jsonapi_dict_many(
+        cls,
+        resources: Iterable["BaseResource"],
+        required_attributes: Union[Iterable[str], Literal["__all__"]],
+        links: Optional[Mapping[str, Union[str, Mapping[str, Any]]]] = None,
+        relationships: Optional[Dict] = None,
+        dontformat: bool = False
+    ) -> list:
+        """Export several resources of this class as a list of dictionaries.
+
+        This is the bulk counterpart of `BaseResource.jsonapi_dict()`: the
+        `required_attributes` resolution and the `links` validation are
+        performed once for the whole collection instead of once per resource,
+        which makes it the preferred entry point for dumping list responses.
+
+        ###### Parameters ######
+
+        - `resources`: an iterable of resources to export. They must all be
+        instances of this resource class.
+
+        For a documentation about the other parameters, see
+        `BaseResource.jsonapi_dict()`.
+
+        ###### Returned value ######
+
+        A list of dictionaries representing the resources in compliance with
+        the JSON:API specification.
+
+        ###### Errors raised ######
+
+        See `BaseResource.jsonapi_dict()`.
+        """
+        if not (type(required_attributes) is str
+                and required_attributes == "__all__"):
+            # materialize once: a one-pass iterator would be consumed by the
+            # up-front resolution and yield nothing for the per-resource calls
+            required_attributes = frozenset(required_attributes)
+            cls._resolve_required_attributes(required_attributes)
+        if links:
+            cls._validate_links(links)
+        resource_name = cls.__resource_name__
+        documents = []
+        for resource in resources:
+            try:
+                resource_id = resource.id
+            except AttributeError:
+                raise AttributeError(
+                    f"This '{cls.__name__}' object has no id.") from None
+            attributes, meta_attributes = resource._filtered_attributes(
+                required_attributes, dontformat)
+            documents.append({
+                "type": resource_name,
+                "id": resource_id,
+                **({"attributes": attributes} if attributes else {}),
+                **({"relationships": resource._formatted_relationships(relationships)}
+                   if relationships else {}),
+                **({"links": resource._make_links(links)} if links else {}),
+                **({"meta": meta_attributes} if meta_attributes else {}),
+            })
+        return documents
 
     def dump(
         self,
         required_attributes: Union[Iterable[str], Literal["__all__"]],
         links: Optional[Dict] = None,
         relationships: Optional[Dict] = None,
-        dump_function: Callable[[Dict], str] = json.dumps,
+        dump_function: Callable[[Dict], str] = _default_dump_function,
     ) -> str:
         """Call `jsonapi_dict()` method and dump the result with `dump_function`.
 
@@ -555,7 +824,10 @@ class BaseResource(metaclass=BaseResourceMeta):
         parameters, see `BaseResource.jsonapi_dict()` method.
 
         - `dump_function`: a function used to dump the dictionary returned by
-        `jsonapi_dict()` method. By default, the dump function is `json.dumps()`.
+        `jsonapi_dict()` method. By default, the dictionary is dumped with
+        [`orjson`](https://github.com/ijl/orjson) when it is installed, else
+        with `json.dumps()`. Callers needing a `bytes` payload can pass
+        `orjson.dumps` directly and skip the decoding step.
 
         ###### Returned value ######
 
@@ -569,6 +841,75 @@ class BaseResource(metaclass=BaseResourceMeta):
             self.jsonapi_dict(required_attributes, links, relationships)
         )
 
+    def dump_bytes(
+        self,
+        required_attributes: Union[Iterable[str], Literal["__all__"]],
+        links: Optional[Dict] = None,
+        relationships: Optional[Dict] = None,
+        dump_function: Callable[[Dict], bytes] = _default_bytes_dump_function,
+    ) -> bytes:
+        """Like `dump()`, but return a `bytes` payload.
+
+        When [`orjson`](https://github.com/ijl/orjson) is installed, this
+        skips the decoding step of `dump()`: callers writing to a socket or
+        an HTTP response body can consume the bytes directly.
+
+        ###### Parameters ######
+
+        For a documentation about the `required_attributes`, `links`,
+        `relationships` parameters, see `BaseResource.jsonapi_dict()` method.
+
+        - `dump_function`: a function dumping a dictionary into `bytes`. By
+        default, `orjson.dumps` when it is installed, else `json.dumps()`
+        followed by an encoding step.
+
+        ###### Returned value ######
+
+        A `bytes` dump of the JSON:API-compliant dictionary export of the
+        object.
+
+        ###### Error raised ######
+
+        See `BaseResource.jsonapi_dict()`.
+        """
+        return dump_function(
+            self.jsonapi_dict(required_attributes, links, relationships)
+        )
+
+    def dump_stream(
+        self,
+        write: Callable[[str], Any],
+        required_attributes: Union[Iterable[str], Literal["__all__"]],
+        links: Optional[Dict] = None,
+        relationships: Optional[Dict] = None,
+    ) -> None:
+        """Write the JSON dump incrementally instead of building one string.
+
+        The JSON is produced chunk by chunk with `json.JSONEncoder.iterencode`
+        and each chunk is passed to `write`, so the full string dump is never
+        materialized in memory. This is useful for writing large payloads
+        directly to a file or a socket.
+
+        ###### Parameters ######
+
+        - `write`: a callable accepting a string chunk, typically the `write`
+        method of a file-like object.
+
+        For a documentation about the `required_attributes`, `links`,
+        `relationships` parameters, see `BaseResource.jsonapi_dict()` method.
+
+        ###### Returned value ######
+
+        `None`
+
+        ###### Error raised ######
+
+        See `BaseResource.jsonapi_dict()`.
+        """
+        data = self.jsonapi_dict(required_attributes, links, relationships)
+        for chunk in _stream_encoder.iterencode(data):
+            write(chunk)
+
     @classmethod
     def register_link_factory(cls, name: str, factory: Callable[..., str]):
         """Add a link factory to the resource.
@@ -598,6 +939,35 @@ class BaseResource(metaclass=BaseResourceMeta):
         """
         _validate_link_name(cls, name)
         cls.__links_factories__[name] = factory
+        _index_links_by_rel(cls)
+        _resolve_links_factories.cache_clear()
+
+    @classmethod
+    def register_link_factories(cls, factories: Dict[str, Callable[..., str]]):
+        """Add several link factories to the resource at once.
+
+        All the names are validated first, then `__links_factories__` is
+        updated in a single pass. See `register_link_factory()` for a
+        documentation about link factories and their naming.
+
+        ###### Parameters ######
+
+        - `factories`: a dictionary mapping link names to factories.
+
+        ###### Returned value ######
+
+        `None`
+
+        ###### Errors raised ######
+
+        If one of the names refers to a relationship that does not exist,
+        raise a `ValueError` (and register nothing).
+        """
+        for name in factories:
+            _validate_link_name(cls, name)
+        cls.__links_factories__.update(factories)
+        _index_links_by_rel(cls)
+        _resolve_links_factories.cache_clear()
 
     @classmethod
     def evaluate_forward_refs(cls):
@@ -609,8 +979,20 @@ class BaseResource(metaclass=BaseResourceMeta):
         To evaluate the type hints, call `BaseResource.evaluate_forward_refs()`
         when all needed resources are defined.
         """
-        _make_fields_meta_attributes(
-            cls, cls._forbidden_fields, type(cls))
+        # cold, user-invoked path: resolve the whole class (inherited hints
+        # included, the bases may still carry raw annotations) and reclassify
+        # every field from the evaluated hints
+        frame = inspect.currentframe()
+        try:
+            fields_type_hints = get_type_hints(
+                cls,
+                localns=frame.f_back.f_locals,
+                globalns=frame.f_back.f_globals)
+        finally:
+            del frame
+        _set_fields_special_attributes(
+            cls, _FORBIDDEN_FIELDS, type(cls), fields_type_hints,
+            reclassify_all=True)
 
     ###########################################################################
     #                                                                         #
@@ -619,48 +1001,10 @@ class BaseResource(metaclass=BaseResourceMeta):
     #                                                                         #
     ###########################################################################
 
-    ###########################################################################
-    #                  P R O P E R T I E S   A N D   U T I L S                #
-    ###########################################################################
-
-    @property
-    def _identifier_dict(self):
-        identifier_dict = {
-            "type": self.__resource_name__,
-            "id": self.id,
-        }
-        if self.__identifier_meta_attributes__:
-            identifier_dict["meta"] = {name: getattr(self, name) for name in self.__identifier_meta_attributes__}
-        return identifier_dict
-
-    @staticmethod
-    def _qualname(name: str, relationship: Optional[str] = None):
-        return f"{relationship}__{name}" if relationship else name
-
     ###########################################################################
     #                           V A L I D A T I O N                           #
     ###########################################################################
 
-    @classmethod
-    def _validate_relationships(cls, relationships: Dict) -> None:
-        """Make sure that the provided `relationships` dictionary is valid
-
-        - The keys must refer an existing relationships field.
-        - The values must contain at least a data or a links member.
-
-        Raise a `ValueError` if the dictionary is not valid.
-        """
-        errors = []
-        for name, rel_dict in relationships.items():
-            if name not in cls.__relationships_fields_set__:
-                errors.append(f"    '{name}' is not a valid relationship.")
-            if (rel_dict.get("links") is None and rel_dict.get("data")) is None:
-                errors.append(
-                    f"    You must provide at least links or data for the '{name}' relationship."
-                )
-        if errors:
-            raise ValueError("\n" + "\n".join(errors))
-
     @classmethod
     def _validate_links(cls, links, relationship: Optional[str] = None):
         """Make sure that the links are registered in the resource class.
@@ -670,18 +1014,25 @@ class BaseResource(metaclass=BaseResourceMeta):
         to get the value of the keys not present in __links_factories__.
         If at least one name is not valid, raise a `ValueError`.
         """
-        errors = []
-        for name in links:
-            qual_name = cls._qualname(name, relationship)
-            if qual_name in cls.__links_factories__:
-                if not isinstance(links[name], Mapping):
-                    errors.append(f"    You must provide an arguments dictionary for '{qual_name}' link.")
+        prefix = f"{relationship}__" if relationship else ""
+        registered_names = cls.__links_by_rel__.get(relationship, frozenset())
+        errors = None
+        for name, provided_link in links.items():
+            # exact-type checks first: callers pass plain dicts and strings,
+            # the ABC isinstance is only a fallback for exotic mappings
+            if name in registered_names:
+                if not (type(provided_link) is dict
+                        or isinstance(provided_link, Mapping)):
+                    errors = errors or []
+                    errors.append(f"    You must provide an arguments dictionary for '{prefix}{name}' link.")
                 continue
-            provided_link = links.get(name)
             if provided_link is None:
-                errors.append(f"    Nothing provided for building '{qual_name}' link.")
-            elif not isinstance(links[name], str):
-                errors.append(f"    Provided '{qual_name}' link is not a string.")
+                errors = errors or []
+                errors.append(f"    Nothing provided for building '{prefix}{name}' link.")
+            elif not (type(provided_link) is str
+                      or isinstance(provided_link, str)):
+                errors = errors or []
+                errors.append(f"    Provided '{prefix}{name}' link is not a string.")
         if errors:
             raise ValueError("\n" + "\n".join(errors))
 
@@ -689,6 +1040,36 @@ class BaseResource(metaclass=BaseResourceMeta):
     #            F O R M A T T I N G   A N D   F I L T E R I N G              #
     ###########################################################################
 
+    @classmethod
+    def _resolve_required_attributes(
+        cls, required_attributes: Iterable[str]
+    ) -> Tuple[frozenset, frozenset, bool]:
+        """Validate a required attributes iterable and resolve it into sets.
+
+        Return a `(fields, dumped_fields, include_meta)` tuple where `fields`
+        is the set of atomic fields to fetch, `dumped_fields` the subset of
+        them to include in the `"attributes"` object and `include_meta` a
+        boolean indicating if the `meta` object is required.
+
+        Since resources are usually dumped in bulk with a same
+        `required_attributes` argument, the resolved tuples are cached in the
+        `__required_cache__` class attribute. If a name is not a valid
+        attribute, raise a `ValueError`.
+        """
+        key = frozenset(required_attributes)
+        cached = cls.__required_cache__.get(key)
+        if cached is not None:
+            return cached
+        fields = key - {"meta"}
+        atomic_fields = cls.__atomic_fields_set__
+        if not fields <= atomic_fields:
+            raise ValueError("\n" + "\n".join(
+                f"    Unexpected required attribute: '{name}'."
+                for name in fields - atomic_fields))
+        resolved = (fields, fields - _IDENTIFIER_FIELDS, "meta" in key)
+        cls.__required_cache__[key] = resolved
+        return resolved
+
     def _filtered_attributes(
         self, required_attributes: Union[Iterable, Literal["__all__"]], dontformat=False
     ) -> Tuple[Dict, Dict]:
@@ -697,54 +1078,77 @@ class BaseResource(metaclass=BaseResourceMeta):
         If a member of the iterable is not in the annotated attributes, raise a
         `ValueError`. The names are converted from snake case to camel case.
         """
-        if required_attributes == "__all__":
-            required_attributes = self.__atomic_fields_set__ | {"meta"}
-        required_attributes = set(required_attributes)
-        errors = []
-        attrs = {name: getattr(self, name, None) for name in required_attributes-{"meta"}}
-        for name in required_attributes - {"meta"}:
-            if name not in self.__atomic_fields_set__:
-                errors.append(f"    Unexpected required attribute: '{name}'.")
+        if (type(required_attributes) is str
+                and required_attributes == "__all__"):
+            fields, dumped_fields, include_meta = self.__all_resolved__
+        else:
+            fields, dumped_fields, include_meta = self._resolve_required_attributes(
+                required_attributes)
+        camel_names = self.__camel_names__
+        optional_fields = self.__optional_fields__
+        errors = None
+        attrs = {}
+        for name in fields:
+            value = getattr(self, name, None)
+            if value is None and name not in optional_fields:
+                errors = errors or []
+                errors.append(f"    Missing required attribute: '{name}'.")
                 continue
-            if attrs.get(name) is None:
-                if not utils.is_an_optional_type_hint(self.__fields_types__[name]):
-                    errors.append(f"    Missing required attribute: '{name}'.")
+            if name in dumped_fields:
+                attrs[name if dontformat else camel_names[name]] = value
         if errors:
             raise ValueError("\n" + "\n".join(errors))
-        attrs = {
-            utils.snake_to_camel_case(k, dontformat): v
-            for (k, v) in attrs.items()
-            if k in set(required_attributes) - self._identifier_fields
-        }
-        meta_attrs = {
-            utils.snake_to_camel_case(name, dontformat): getattr(self, name)
-            for name in self.__meta_attributes__
-            if getattr(self, name) is not None
-        } if "meta" in required_attributes else None
+        meta_attrs = None
+        if include_meta:
+            meta_attrs = {}
+            for name in self.__meta_attributes__:
+                value = getattr(self, name, None)
+                if value is not None:
+                    meta_attrs[name if dontformat else camel_names[name]] = value
         return attrs, meta_attrs
 
     def _formatted_relationships(self, relationships: Dict) -> Dict:
-        """Format relationships into the JSON:API format."""
+        """Validate and format relationships into the JSON:API format.
+
+        Validation and formatting are done in a single pass:
+
+        - The keys must refer an existing relationships field.
+        - The values must contain at least a data or a links member.
+
+        Raise a `ValueError` if one of the provided relationships is invalid.
+        """
         relationships_dict = {}
+        errors = None
         for name, rel_payload in relationships.items():
+            if name not in self.__relationships_fields_set__:
+                errors = errors or []
+                errors.append(f"    '{name}' is not a valid relationship.")
+                continue
+            relationship_links = rel_payload.get("links")
+            data_is_required = rel_payload.get("data")
+            if relationship_links is None and data_is_required is None:
+                errors = errors or []
+                errors.append(
+                    f"    You must provide at least links or data for the '{name}' relationship."
+                )
+                continue
             rel_value: Union[Iterable[BaseResource], BaseResource] = getattr(self, name)
-            multiple_relationship = isinstance(rel_value, collections.abc.Iterable)
+            multiple_relationship = name in self.__iterable_fields__
             if not rel_value:  # None or empty
                 relationships_dict[name] = [] if multiple_relationship else None
                 continue
-            relationship_links = rel_payload.get("links")
-            data_is_required = rel_payload.get("data")
-            rel_data = {}
             if relationship_links:
                 self._validate_links(relationship_links, relationship=name)
-                rel_data["links"] = self._make_links(relationship_links, relationship=name)
-            relationships_dict[name] = rel_data
-            if data_is_required:
-                rel_data["data"] = (
-                    [rel._identifier_dict for rel in rel_value]
+            relationships_dict[name] = {
+                **({"links": self._make_links(relationship_links, relationship=name)}
+                   if relationship_links else {}),
+                **({"data": [rel._identifier_dict for rel in rel_value]
                     if multiple_relationship
-                    else rel_value._identifier_dict
-                )
+                    else rel_value._identifier_dict}
+                   if data_is_required else {}),
+            }
+        if errors:
+            raise ValueError("\n" + "\n".join(errors))
         return relationships_dict
 
     def _make_links(self,
@@ -756,34 +1160,57 @@ class BaseResource(metaclass=BaseResourceMeta):
         """
         evaluated_links = {}
         for name, link_payload in links.items():
-            evaluated_links[name] = link_payload
-            for param, arg in link_payload.items():
-                evaluated_links[name][param] = (
-                    arg(self) if callable(arg) else arg)
-        links_factories = self.__links_factories__
-        return {
-            name: links_factories[self._qualname(name, relationship)](**evaluated_links[name])
-            if links_factories.get(self._qualname(name, relationship)) is not None
-            else evaluated_links[name]
-            for name in evaluated_links
-        }
+            if type(link_payload) is dict or isinstance(link_payload, Mapping):
+                # evaluate into a fresh dict: the caller's payload may be
+                # reused for other resources (e.g. in jsonapi_dict_many())
+                evaluated_links[name] = {
+                    param: (arg(self) if callable(arg) else arg)
+                    for param, arg in link_payload.items()}
+            else:
+                evaluated_links[name] = link_payload
+        resolved_factories = _resolve_links_factories(
+            type(self), relationship, frozenset(evaluated_links))
+        # iterate the caller's mapping so the output keys keep its order
+        final_links = {}
+        for name, link_payload in evaluated_links.items():
+            factory = resolved_factories[name]
+            final_links[name] = (factory(**link_payload)
+                                 if factory is not None
+                                 else link_payload)
+        return final_links
 
     ###########################################################################
     #                     S P E C I A L   M E T H O D S                       #
     ###########################################################################
 
     def __repr__(self):
+        if self.__use_slots__:
+            # collect the slotted fields, skipping unset ones instead of
+            # raising; __getattribute__ bypasses the __getattr__ fallback
+            collected = {}
+            for name in self.__fields_types__:
+                try:
+                    collected[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    continue
+            # a dict-carrying subclass of a slotted resource has both
+            instance_dict = getattr(self, "__dict__", None)
+            if instance_dict:
+                collected.update(instance_dict)
+            items = collected.items()
+        else:
+            items = self.__dict__.items()
         return (f"{self.__class__.__name__}"
-                f"({', '.join(f'{k}={repr(v)}' for k, v in self.__dict__.items())})")
+                f"({', '.join(f'{k}={repr(v)}' for k, v in items)})")
 
     def __getattr__(self, name):
         """Dynamically return None or [] for not-yet-initialized fields"""
         if name == "id":
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-        type_hint = self.__fields_types__.get(name)
-        if type_hint is None and name not in self.__meta_attributes__:
+        if (name not in self.__fields_types__
+                and name not in self.__meta_attributes__):
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-        if utils.is_an_iterable_type_hint(type_hint):
+        if name in self.__iterable_fields__:
             return []
         return None
 
@@ -828,7 +1255,7 @@ def create_resource(
             "Only a submetaclass of BaseResourceMeta can create a new "
             f"resource class. ('{metaklass}' provided.)")
     if isinstance(bases, type):
-        bases = tuple(bases.mro())
+        bases = bases.__mro__
     if BaseResource not in bases:
         raise TypeError(
             "'BaseResource' class must be a parent class of any resource "
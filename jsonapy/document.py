@@ -6,7 +6,7 @@
 
 > **WIP:** This module is under construction
 """
-import collections.abc
+from collections.abc import Iterable as IterableABC
 from typing import Dict
 from typing import Iterable
 from typing import Literal
@@ -29,7 +29,7 @@ class JSONAPIDocument:
         included: Optional[Dict] = None
     ):
         # store data
-        if isinstance(data, collections.abc.Iterable):
+        if isinstance(data, IterableABC):
             if all(isinstance(obj, BaseResource) for obj in data):
                 self.single = False
             else:
@@ -57,10 +57,11 @@ class JSONAPIDocument:
         self.included = included
 
     def jsonapi_dict(self):
+        opts = self.data_export_options
         data = (
-            [obj.jsonapi_dict(**self.data_export_options) for obj in self.data]
+            [obj.jsonapi_dict(**opts) for obj in self.data]
             if not self.single
-            else self.data.jsonapi_dict(**self.data_export_options)
+            else self.data.jsonapi_dict(**opts)
         )
         return {"data": data}
 
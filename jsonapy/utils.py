@@ -9,9 +9,13 @@ This module defines utilitarian members used in the library.
 import collections.abc
 import functools
 import re
+import types
 import typing
 from typing import Union
 
+# PEP 604 unions (X | None) have their own origin type on Python 3.10+
+_union_types = {Union, getattr(types, "UnionType", Union)}
+
 
 def snake_to_camel_case(text: str, dontformat: bool = False) -> str:
     """Convert a snake_case string into camelCase format if needed.
@@ -69,7 +73,7 @@ def is_type_hint_instance_of(type_hint, mcs) -> bool:
     if origin is None:
         return False
     type_args = typing.get_args(type_hint)
-    if origin is Union:
+    if origin in _union_types:
         # in case of Optional field, check if it is Union[BaseResourceMeta, None]
         if len(type_args) != 2:
             return False
@@ -132,7 +136,7 @@ def is_an_optional_type_hint(type_hint) -> bool:
     if origin is None:
         return False
     type_args = typing.get_args(type_hint)
-    if origin is Union:
+    if origin in _union_types:
         # in case of Optional field, check if it is Union[..., None]
         if len(type_args) != 2:
             return False
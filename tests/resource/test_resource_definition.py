@@ -74,6 +74,26 @@ def test_resource_definition_with_postponed_evaluated_type_hints():
     }
 
 
+def test_forward_refs_evaluation_on_subclass():
+    class ParentResource(BaseResource):
+        id: int
+        rel: "TargetResource"
+
+        class Meta:
+            is_abstract = True
+
+    class ChildResource(ParentResource):
+        id: int
+
+    class TargetResource(BaseResource):
+        id: int
+
+    ChildResource.evaluate_forward_refs()
+
+    assert ChildResource.__fields_types__["rel"] is TargetResource
+    assert ChildResource.__relationships_fields_set__ == {"rel"}
+
+
 def test_resource_definition_with_complex_attributes():
     class AResource(BaseResource):
         id: int
@@ -165,6 +185,24 @@ def test_relationship_link():
     assert BResource.__links_factories__ == {"rel__related": make_link, "rel__self": make_link2}
 
 
+def test_batch_link_registering():
+    class AResource(BaseResource):
+        id: int
+
+    class BResource(BaseResource):
+        id: int
+        rel: AResource
+
+    BResource.register_link_factories({"self": make_link, "rel__related": make_link2})
+
+    assert BResource.__links_factories__ == {"self": make_link, "rel__related": make_link2}
+
+    with pytest.raises(ValueError) as err:
+        BResource.register_link_factories({"other__self": make_link})
+
+    assert str(err.value) == "'other' is not a valid relationship for BResource."
+
+
 def test_invalid_relationship_link():
     with pytest.raises(ValueError) as err:
         class AResource(BaseResource):
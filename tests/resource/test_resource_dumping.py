@@ -10,6 +10,7 @@ from typing import Union
 import pytest
 
 from jsonapy import BaseResource
+from jsonapy.base import _default_dump_function
 
 
 class SimpleResource(BaseResource):
@@ -351,8 +352,64 @@ def test_relationship_invalid_options(related_object: RelatedResource):
     assert str(err.value) == "\n    You must provide at least links or data for the 'related_more' relationship."
 
 
+def test_dict_many_dumping():
+    objects = [SimpleResource(id=i, name=f"Name {i}") for i in range(3)]
+    expected = [
+        {"type": "less",
+         "id": i,
+         "attributes": {"name": f"Name {i}"},
+         "links": {"self": f"http://example.com/less/{i}"}}
+        for i in range(3)
+    ]
+    assert SimpleResource.jsonapi_dict_many(
+        objects,
+        required_attributes="__all__",
+        links={"self": {"res_id": operator.attrgetter("id")}},
+    ) == expected
+
+
+def test_uncamelized_dumping():
+    class SnakeResource(BaseResource):
+        id: int
+        first_name: str
+
+        class Meta:
+            resource_name = "snake"
+            camelize = False
+
+    expected = {
+        "type": "snake",
+        "id": 0,
+        "attributes": {"first_name": "John"},
+    }
+    assert (SnakeResource(id=0, first_name="John").jsonapi_dict("__all__")
+            == expected)
+
+
+def test_bytes_dump(simple_object: SimpleResource):
+    dumped = simple_object.dump_bytes(required_attributes="__all__")
+
+    assert isinstance(dumped, bytes)
+    assert json.loads(dumped) == {
+        "type": "less",
+        "id": 0,
+        "attributes": {"name": "Simple Name"},
+    }
+
+
+def test_stream_dump(simple_object: SimpleResource):
+    chunks = []
+    simple_object.dump_stream(chunks.append, required_attributes="__all__")
+
+    assert json.loads("".join(chunks)) == {
+        "type": "less",
+        "id": 0,
+        "attributes": {"name": "Simple Name"},
+    }
+
+
 def test_str_dump(related_object: RelatedResource):
-    expected = json.dumps({
+    expected = _default_dump_function({
         "type": "related",
         "id": 2,
         "attributes": {"foo": "bar"},
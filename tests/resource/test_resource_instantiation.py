@@ -66,6 +66,39 @@ def test_not_exported_attribute():
     assert repr(inst) == "ConcreteResource(id=1, name='John', lastname='Doe', gender='M')"
 
 
+def test_slotted_resource():
+    class SlottedResource(BaseResource):
+        id: int
+        name: str
+
+        class Meta:
+            use_slots = True
+
+    inst = SlottedResource(id=1, name="John")
+
+    assert not hasattr(inst, "__dict__")
+    assert inst.name == "John"
+    assert repr(inst) == "SlottedResource(id=1, name='John')"
+    assert repr(SlottedResource(name="John")) == "SlottedResource(name='John')"
+    assert inst.jsonapi_dict("__all__") == {
+        "type": "SlottedResource",
+        "id": 1,
+        "attributes": {"name": "John"}}
+
+
+def test_slotted_resource_with_default_value():
+    with pytest.raises(ValueError) as err:
+        class SlottedResource(BaseResource):
+            id: int
+            name: str = "John"
+
+            class Meta:
+                use_slots = True
+
+    assert str(err.value) == ("Slotted resources cannot define default values "
+                              "for their fields: 'name'.")
+
+
 def test_reserved_attribute():
     with pytest.raises(ValueError) as err:
         inst = ConcreteResource(id=1, name="John", lastname="Doe", jsonapi_dict="Illegal")